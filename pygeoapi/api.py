@@ -37,7 +37,7 @@ import asyncio
 from collections import OrderedDict
 from copy import deepcopy
 from datetime import datetime, timezone
-from functools import partial
+from functools import lru_cache, partial
 from gzip import compress
 import json
 import logging
@@ -142,6 +142,12 @@ CONFORMANCE = {
 
 OGC_RELTYPES_BASE = 'http://www.opengis.net/def/rel/ogc/1.0'
 
+# subset parameter patterns: axis(values), "min":"max", "value", min:max
+SUBSET_AXIS = re.compile(r'(.*)\((.*)\)')
+SUBSET_STRING_INTERVAL = re.compile(r'"(\S+)":"(\S+)"')
+SUBSET_STRING_POINT = re.compile(r'"(.*)"')
+SUBSET_NUMBER_INTERVAL = re.compile(r'(\S+):(\S+)')
+
 
 def pre_process(func):
     """
@@ -3324,10 +3330,10 @@ def validate_datetime(resource_def, datetime_=None) -> str:
 
     if datetime_ is not None and 'temporal' in resource_def:
 
-        dateparse_begin = partial(dateparse, default=datetime.min)
-        dateparse_end = partial(dateparse, default=datetime.max)
+        dateparse_begin = partial(_dateparse, default=datetime.min)
+        dateparse_end = partial(_dateparse, default=datetime.max)
         unix_epoch = datetime(1970, 1, 1, 0, 0, 0)
-        dateparse_ = partial(dateparse, default=unix_epoch)
+        dateparse_ = partial(_dateparse, default=unix_epoch)
 
         te = resource_def['temporal']
 
@@ -3346,8 +3352,10 @@ def validate_datetime(resource_def, datetime_=None) -> str:
             LOGGER.debug('Validating time windows')
 
             # normalize "" to ".." (actually changes datetime_)
-            datetime_ = re.sub(r'^/', '../', datetime_)
-            datetime_ = re.sub(r'/$', '/..', datetime_)
+            if datetime_.startswith('/'):
+                datetime_ = '..' + datetime_
+            if datetime_.endswith('/'):
+                datetime_ += '..'
 
             datetime_begin, datetime_end = datetime_.split('/')
             if datetime_begin != '..':
@@ -3389,6 +3397,21 @@ def validate_datetime(resource_def, datetime_=None) -> str:
     return datetime_
 
 
+@lru_cache(maxsize=1024)
+def _dateparse(value: str, default: datetime) -> datetime:
+    """
+    Helper function to parse a datetime parameter value, caching the result
+    as the same values tend to be requested repeatedly
+
+    :param value: `str` of datetime
+    :param default: `datetime` providing the components missing from value
+
+    :returns: `datetime` of parsed value
+    """
+
+    return dateparse(value, default=default)
+
+
 def validate_subset(value: str) -> dict:
     """
     Helper function to validate subset parameter
@@ -3402,7 +3425,7 @@ def validate_subset(value: str) -> dict:
 
     for s in value.split(','):
         LOGGER.debug('Processing subset {}'.format(s))
-        m = re.search(r'(.*)\((.*)\)', s)
+        m = SUBSET_AXIS.search(s)
         subset_name, values = m.group(1, 2)
 
         if '"' in values:
@@ -3413,17 +3436,17 @@ def validate_subset(value: str) -> dict:
                 raise ValueError(msg)
             try:
                 LOGGER.debug('Value is an interval')
-                m = re.search(r'"(\S+)":"(\S+)"', values)
+                m = SUBSET_STRING_INTERVAL.search(values)
                 values = list(m.group(1, 2))
             except AttributeError:
                 LOGGER.debug('Value is point')
-                m = re.search(r'"(.*)"', values)
+                m = SUBSET_STRING_POINT.search(values)
                 values = [m.group(1)]
         else:
             LOGGER.debug('Values are numbers')
             try:
                 LOGGER.debug('Value is an interval')
-                m = re.search(r'(\S+):(\S+)', values)
+                m = SUBSET_NUMBER_INTERVAL.search(values)
                 values = list(m.group(1, 2))
             except AttributeError:
                 LOGGER.debug('Value is point')
@@ -37,7 +37,9 @@ LOGGER = logging.getLogger(__name__)
 class BaseEDRProvider(BaseProvider):
     """Base EDR Provider"""
 
-    query_types = []
+    # names of registered query methods, immutable so that callers of
+    # get_query_types cannot alter the registry
+    query_types = ()
 
     def __init__(self, provider_def):
         """
@@ -55,7 +57,7 @@ class BaseEDRProvider(BaseProvider):
     @classmethod
     def register(cls):
         def inner(fn):
-            cls.query_types.append(fn.__name__)
+            cls.query_types += (fn.__name__,)
             return fn
         return inner
 
@@ -72,7 +74,7 @@ class BaseEDRProvider(BaseProvider):
         """
         Provide supported query types
 
-        :returns: `list` of EDR query types
+        :returns: `tuple` of EDR query types
         """
 
         return self.query_types
@@ -91,7 +93,10 @@ class BaseEDRProvider(BaseProvider):
         :returns: coverage data as `dict` of CoverageJSON or native format
         """
 
-        try:
-            return getattr(self, kwargs.get('query_type'))(**kwargs)
-        except AttributeError:
+        # dispatch to registered query types only, and without catching
+        # errors raised by the query itself
+        query_type = kwargs.get('query_type')
+        if query_type not in self.query_types:
             raise NotImplementedError('Query not implemented!')
+
+        return getattr(self, query_type)(**kwargs)
@@ -43,24 +43,62 @@
 # gunzip < tests/data/hotosm_bdi_waterways.sql.gz |
 #  psql -U postgres -h 127.0.0.1 -p 5432 test
 
+import atexit
+from collections import OrderedDict
+from hashlib import sha1
 import logging
 import json
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from weakref import WeakKeyDictionary
 import psycopg2
-from psycopg2.sql import SQL, Identifier, Literal
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from psycopg2.sql import SQL, Identifier, Placeholder
 from pygeoapi.provider.base import BaseProvider, \
     ProviderConnectionError, ProviderQueryError, ProviderItemNotFoundError
 
-from psycopg2.extras import RealDictCursor
-
 LOGGER = logging.getLogger(__name__)
 
+# Maximum number of connections kept open per connection parameters
+POOL_MAXCONN = 10
+
+# Seconds to wait for a free pooled connection before giving up
+POOL_TIMEOUT = 30
+
+# Connection pools per connection parameters and pool size, each with a
+# semaphore counting its free connections
+_POOLS = {}
+_POOLS_LOCK = Lock()
+
+# Column names and types per (connection parameters, table, properties),
+# stored with the time they were looked up
+_COLUMNS_CACHE = {}
+
+# Seconds after which cached column names and types are looked up again
+COLUMNS_CACHE_TTL = 300
+
+# Whether the id field is unique per (connection parameters, table, id
+# field), stored with the time it was looked up; also kept for
+# COLUMNS_CACHE_TTL seconds
+_UNIQUE_ID_CACHE = {}
+
+# Column aliases of the previous and next IDs in single item lookups
+PREV_COLUMN = 'pygeoapi_prev'
+NEXT_COLUMN = 'pygeoapi_next'
+
+# Names of the statements prepared on each pooled connection, least
+# recently used first, and the most kept prepared per connection
+_PREPARED = WeakKeyDictionary()
+PREPARED_MAX = 16
+
 
 class DatabaseConnection:
     """Database connection class to be used as 'with' statement.
      The class returns a connection object.
     """
 
-    def __init__(self, conn_dic, table, properties=[], context="query"):
+    def __init__(self, conn_dic, table, properties=[], context="query",
+                 pool_size=POOL_MAXCONN):
         """
         PostgreSQLProvider Class constructor returning
 
@@ -84,6 +122,8 @@ class DatabaseConnection:
         :param properties: User-specified subset of column names to expose
         :param context: query or hits, if query then it will determine
                 table column otherwise will not do it
+        :param pool_size: maximum number of connections kept open for the
+                connection parameters
         :returns: DatabaseConnection
         """
 
@@ -93,45 +133,70 @@ class DatabaseConnection:
         self.columns = None
         self.properties = properties
         self.fields = {}  # Dict of columns. Key is col name, value is type
-        self.conn = None
+        self.pool_size = pool_size
+        self.pool = None
+        self._slots = None
+        self._conn = None
+
+    @property
+    def conn(self):
+        """
+        Connection checked out from the pool on first use, so that lookups
+        answered from cache do not need one
+
+        :returns: psycopg2 connection
+        """
+
+        if self._conn is None:
+            try:
+                self.pool, slots = self._get_pool()
+                # getconn() raises PoolError when all connections are in
+                # use, so wait for one to be handed back instead
+                if not slots.acquire(timeout=POOL_TIMEOUT):
+                    LOGGER.error('No free connection to Postgis after '
+                                 '{} seconds'.format(POOL_TIMEOUT))
+                    raise ProviderConnectionError()
+                self._slots = slots
+                self._conn = self.pool.getconn()
+                # statements are read-only, no need for a transaction block
+                self._conn.autocommit = True
+
+            except psycopg2.OperationalError:
+                self._release_slot()
+                LOGGER.error("Couldn't connect to Postgis using:{}".format(
+                    str(self.conn_dic)))
+                raise ProviderConnectionError()
+            except PoolError as err:
+                self._release_slot()
+                LOGGER.error(err)
+                raise ProviderConnectionError()
+
+        return self._conn
 
     def __enter__(self):
-        try:
-            search_path = self.conn_dic.pop('search_path', ['public'])
-            if search_path != ['public']:
-                self.conn_dic["options"] = '-c \
-                search_path={}'.format(",".join(search_path))
-                LOGGER.debug('Using search path: {} '.format(search_path))
-            self.conn = psycopg2.connect(**self.conn_dic)
-            self.conn.set_client_encoding('utf8')
-
-        except psycopg2.OperationalError:
-            LOGGER.error("Couldn't connect to Postgis using:{}".format(
-                str(self.conn_dic)))
-            raise ProviderConnectionError()
-
-        self.cur = self.conn.cursor()
+        search_path = self.conn_dic.pop('search_path', ['public'])
+        if search_path != ['public']:
+            self.conn_dic["options"] = '-c \
+            search_path={}'.format(",".join(search_path))
+            LOGGER.debug('Using search path: %s ', search_path)
+
         if self.context == 'query':
-            # Get table column names and types, excluding geometry and
-            # transaction ID columns
-            query_cols = "SELECT attr.attname, tp.typname \
-            FROM pg_catalog.pg_class as cls \
-            INNER JOIN pg_catalog.pg_attribute as attr \
-                ON cls.oid = attr.attrelid \
-            INNER JOIN pg_catalog.pg_type as tp \
-                ON tp.oid = attr.atttypid \
-            WHERE cls.relname = '{}' \
-                AND tp.typname != 'geometry' \
-                AND tp.typname != 'cid' \
-                AND tp.typname != 'oid' \
-                AND tp.typname != 'tid' \
-                AND tp.typname != 'xid';".format(
-                self.table)
-
-            self.cur.execute(query_cols)
-            result = self.cur.fetchall()
-            if self.properties:
-                result = [res for res in result if res[0] in self.properties]
+            # Table column names and types only change with the schema, so
+            # they are looked up at most once every COLUMNS_CACHE_TTL seconds
+            # per connection parameters and table
+            cache_key = (tuple(sorted(self.conn_dic.items())), self.table,
+                         tuple(self.properties))
+            cached = _COLUMNS_CACHE.get(cache_key)
+            if cached is None or monotonic() - cached[0] > COLUMNS_CACHE_TTL:
+                try:
+                    cached = (monotonic(), self._get_columns())
+                except Exception:
+                    # __exit__ does not run when __enter__ raises
+                    self._put_conn()
+                    raise
+                _COLUMNS_CACHE[cache_key] = cached
+            result = cached[1]
+
             self.columns = SQL(', ').join(
                 [Identifier(item[0]) for item in result]
                 )
@@ -141,15 +206,147 @@ class DatabaseConnection:
 
         return self
 
+    def _get_pool(self):
+        """
+        Get the connection pool for the connection parameters and pool
+        size, creating it on first use
+
+        :returns: `tuple` of psycopg2.pool.ThreadedConnectionPool and
+                  `threading.BoundedSemaphore` of its free connections
+        """
+
+        pool_key = (tuple(sorted(self.conn_dic.items())), self.pool_size)
+        with _POOLS_LOCK:
+            if pool_key not in _POOLS:
+                # pass the client encoding as a startup parameter rather
+                # than issuing a separate SET round trip once connected
+                pool = ThreadedConnectionPool(
+                    1, self.pool_size,
+                    **dict(self.conn_dic, client_encoding='utf8'))
+                atexit.register(pool.closeall)
+                _POOLS[pool_key] = (pool, BoundedSemaphore(self.pool_size))
+            return _POOLS[pool_key]
+
+    def _put_conn(self, close=False):
+        """
+        Hand the connection back to the pool, if one was checked out, and
+        release its pool slot
+
+        :param close: whether to close the connection rather than keep it
+                      for reuse; broken connections are always closed
+
+        :returns: None
+        """
+
+        if self._conn is not None:
+            self.pool.putconn(self._conn,
+                              close=close or bool(self._conn.closed))
+            self._conn = None
+        self._release_slot()
+
+    def _release_slot(self):
+        """
+        Release the pool slot held by this connection, if any
+
+        :returns: None
+        """
+
+        if self._slots is not None:
+            self._slots.release()
+            self._slots = None
+
+    def execute_prepared(self, cursor, sql_query, params):
+        """
+        Execute a statement as a server-side prepared statement, so that it
+        is parsed and planned once per pooled connection instead of once
+        per request
+
+        :param cursor: cursor of this connection
+        :param sql_query: psycopg2.sql.Composed statement using %s
+                          parameter placeholders, as for cursor.execute
+        :param params: sequence of parameter values
+
+        :returns: None
+        """
+
+        statement = sql_query.as_string(self.conn)
+        # column types are part of the name, so that a changed column type
+        # gets a new statement instead of failing on the cached plan
+        name = 'pygeoapi_{}'.format(sha1('{}{}'.format(
+            statement, sorted(self.fields.items())).encode('utf-8')
+        ).hexdigest()[:16])
+
+        prepared = _PREPARED.setdefault(self.conn, OrderedDict())
+        if name in prepared:
+            prepared.move_to_end(name)
+        else:
+            if len(prepared) >= PREPARED_MAX:
+                oldest, _ = prepared.popitem(last=False)
+                cursor.execute(SQL('DEALLOCATE {}').format(
+                    Identifier(oldest)))
+            if params:
+                # number the placeholders $1, $2, ... as PREPARE expects
+                statement = statement % tuple(
+                    '${}'.format(i) for i in range(1, len(params) + 1))
+            cursor.execute(SQL('PREPARE {} AS {}').format(
+                Identifier(name), SQL(statement)))
+            prepared[name] = None
+
+        if params:
+            cursor.execute(SQL('EXECUTE {} ({})').format(
+                Identifier(name),
+                SQL(', ').join(Placeholder() * len(params))), params)
+        else:
+            cursor.execute(SQL('EXECUTE {}').format(Identifier(name)))
+
+    def _get_columns(self):
+        """
+        Get table column names and types, excluding geometry and
+        system columns
+
+        :returns: list of tuples (column name, type name)
+        """
+
+        # resolve the table through the search path to its OID once, rather
+        # than joining pg_class on a name that may exist in several schemas
+        query_cols = "SELECT attr.attname, tp.typname \
+        FROM pg_catalog.pg_attribute as attr \
+        INNER JOIN pg_catalog.pg_type as tp \
+            ON tp.oid = attr.atttypid \
+        WHERE attr.attrelid = quote_ident(%s)::regclass \
+            AND attr.attnum > 0 \
+            AND NOT attr.attisdropped \
+            AND tp.typname != 'geometry' \
+            AND (%s OR attr.attname = ANY(%s::name[])) \
+        ORDER BY attr.attnum;"
+
+        # the user-specified subset of columns is passed as one array
+        # parameter, so that only the exposed columns are returned
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(query_cols, (self.table, not self.properties,
+                                        list(self.properties)))
+        except psycopg2.Error as err:
+            # e.g. a table missing from the search path, or a pooled
+            # connection broken by a server restart, which is closed
+            # rather than handed out again
+            LOGGER.error('Error getting columns of table {}: {}'.format(
+                self.table, err))
+            self._put_conn(close=isinstance(
+                err, (psycopg2.OperationalError, psycopg2.InterfaceError)))
+            raise ProviderQueryError()
+        return cursor.fetchall()
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # some logic to commit/rollback
-        self.conn.close()
+        # hand the connection back to the pool for reuse, unless it was
+        # broken (e.g. server restart) and must not be handed out again
+        self._put_conn()
 
 
 class PostgreSQLProvider(BaseProvider):
     """Generic provider for Postgresql based on psycopg2
-    using sync approach and server side
-    cursor (using support class DatabaseCursor)
+    using sync approach and pooled connections
+    (using support class DatabaseConnection)
     """
 
     def __init__(self, provider_def):
@@ -159,7 +356,7 @@ class PostgreSQLProvider(BaseProvider):
         :param provider_def: provider definitions from yml pygeoapi-config.
                              data,id_field, name set in parent class
                              data contains the connection information
-                             for class DatabaseCursor
+                             for class DatabaseConnection
 
         :returns: pygeoapi.provider.base.PostgreSQLProvider
         """
@@ -170,13 +367,28 @@ class PostgreSQLProvider(BaseProvider):
         self.id_field = provider_def['id_field']
         self.conn_dic = provider_def['data']
         self.geom = provider_def.get('geom_field', 'geom')
+        self.pool_size = provider_def.get('pool_size', POOL_MAXCONN)
+        # prepared statements do not survive transaction pooling (e.g.
+        # pgbouncer), where each statement may run on another backend
+        self.prepared_statements = provider_def.get(
+            'prepared_statements', True)
+
+        # SQL fragments fixed by the provider definition, composed once
+        self._sql_table = Identifier(self.table)
+        self._sql_id = Identifier(self.id_field)
+        self._sql_geojson = SQL(',ST_AsGeoJSON({})').format(
+            Identifier(self.geom))
+        self._sql_bbox = SQL('{} && ST_MakeEnvelope({})').format(
+            Identifier(self.geom), SQL(', ').join(Placeholder() * 4))
 
         LOGGER.debug('Setting Postgresql properties:')
-        LOGGER.debug('Connection String:{}'.format(
-            ",".join(("{}={}".format(*i) for i in self.conn_dic.items()))))
-        LOGGER.debug('Name:{}'.format(self.name))
-        LOGGER.debug('ID_field:{}'.format(self.id_field))
-        LOGGER.debug('Table:{}'.format(self.table))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Connection String:{}'.format(
+                ",".join(("{}={}".format(*i)
+                          for i in self.conn_dic.items()))))
+        LOGGER.debug('Name:%s', self.name)
+        LOGGER.debug('ID_field:%s', self.id_field)
+        LOGGER.debug('Table:%s', self.table)
 
         LOGGER.debug('Get available fields/properties')
         self.get_fields()
@@ -190,7 +402,8 @@ class PostgreSQLProvider(BaseProvider):
         if not self.fields:
             with DatabaseConnection(self.conn_dic,
                                     self.table,
-                                    properties=self.properties) as db:
+                                    properties=self.properties,
+                                    pool_size=self.pool_size) as db:
                 self.fields = db.fields
         return self.fields
 
@@ -201,19 +414,24 @@ class PostgreSQLProvider(BaseProvider):
         :param properties: list of tuples (name, value)
         :param bbox: bounding box [minx,miny,maxx,maxy]
 
-        :returns: psycopg2.sql.Composed or psycopg2.sql.SQL
+        :returns: `tuple` of psycopg2.sql.Composed or psycopg2.sql.SQL
+                  and `list` of query parameters
         """
 
         where_conditions = []
+        params = []
         if properties:
-            property_clauses = [SQL('{} = {}').format(
-                Identifier(k), Literal(v)) for k, v in properties]
-            where_conditions += property_clauses
+            # a single row constructor equality, with the values passed
+            # as query parameters
+            keys, values = zip(*properties)
+            property_clause = SQL('({}) = ({})').format(
+                SQL(', ').join(map(Identifier, keys)),
+                SQL(', ').join(Placeholder() * len(keys)))
+            where_conditions.append(property_clause)
+            params.extend(values)
         if bbox:
-            bbox_clause = SQL('{} && ST_MakeEnvelope({})').format(
-                Identifier(self.geom), SQL(', ').join(
-                    [Literal(bbox_coord) for bbox_coord in bbox]))
-            where_conditions.append(bbox_clause)
+            where_conditions.append(self._sql_bbox)
+            params.extend(bbox)
 
         if where_conditions:
             where_clause = SQL(' WHERE {}').format(
@@ -221,21 +439,60 @@ class PostgreSQLProvider(BaseProvider):
         else:
             where_clause = SQL('')
 
-        return where_clause
+        return where_clause, params
 
     def _make_orderby(self, sortby):
         """
-        Private function: Make STA filter from query properties
+        Private function: Make ORDER BY clause from query properties
 
         :param sortby: list of dicts (property, order)
 
-        :returns: STA $orderby string
+        :returns: psycopg2.sql.Composed ORDER BY clause
         """
-        ret = []
         _map = {'+': 'ASC', '-': 'DESC'}
-        for _ in sortby:
-            ret.append(f"{_['property']} {_map[_['order']]}")
-        return SQL(f"ORDER BY {','.join(ret)}")
+        ret = [SQL('{} {}').format(Identifier(_['property']),
+                                   SQL(_map[_['order']])) for _ in sortby]
+        return SQL('ORDER BY {}').format(SQL(',').join(ret))
+
+    def _id_is_unique(self, db):
+        """
+        Private function: Whether the id field is a NOT NULL column with a
+        unique index of its own (e.g. the primary key)
+
+        :param db: DatabaseConnection of the query
+
+        :returns: `bool` of whether id field values are unique
+        """
+
+        cache_key = (tuple(sorted(db.conn_dic.items())), self.table,
+                     self.id_field)
+        cached = _UNIQUE_ID_CACHE.get(cache_key)
+        if cached is None or monotonic() - cached[0] > COLUMNS_CACHE_TTL:
+            query_unique = "SELECT EXISTS (SELECT 1 \
+            FROM pg_catalog.pg_index as ind \
+            INNER JOIN pg_catalog.pg_attribute as attr \
+                ON attr.attrelid = ind.indrelid \
+                AND attr.attnum = ind.indkey[0] \
+            WHERE ind.indrelid = quote_ident(%s)::regclass \
+                AND ind.indisunique \
+                AND ind.indnatts = 1 \
+                AND ind.indpred IS NULL \
+                AND attr.attnotnull \
+                AND attr.attname = %s);"
+
+            cursor = db.conn.cursor()
+            try:
+                cursor.execute(query_unique, (self.table, self.id_field))
+                unique = cursor.fetchone()[0]
+            except psycopg2.Error as err:
+                # DISTINCT is correct either way, only slower
+                LOGGER.warning('Error checking uniqueness of {}: {}'.format(
+                    self.id_field, err))
+                unique = False
+            cached = (monotonic(), unique)
+            _UNIQUE_ID_CACHE[cache_key] = cached
+
+        return cached[1]
 
     def query(self, offset=0, limit=10, resulttype='results',
               bbox=[], datetime_=None, properties=[], sortby=[],
@@ -265,114 +522,136 @@ class PostgreSQLProvider(BaseProvider):
             with DatabaseConnection(self.conn_dic,
                                     self.table,
                                     properties=self.properties,
+                                    pool_size=self.pool_size,
                                     context="hits") as db:
-                cursor = db.conn.cursor(cursor_factory=RealDictCursor)
-
-                where_clause = self.__get_where_clauses(
+                where_clause, params = self.__get_where_clauses(
                     properties=properties, bbox=bbox)
                 sql_query = SQL("SELECT COUNT(*) as hits from {} {}").\
-                    format(Identifier(self.table), where_clause)
+                    format(self._sql_table, where_clause)
+
+                # the connection is only checked out once the statement
+                # is composed
+                cursor = db.conn.cursor()
                 try:
-                    cursor.execute(sql_query)
+                    cursor.execute(sql_query, params)
                 except Exception as err:
                     LOGGER.error('Error executing sql_query: {}: {}'.format(
                         sql_query.as_string(cursor), err))
                     raise ProviderQueryError()
 
-                hits = cursor.fetchone()["hits"]
+                hits = cursor.fetchone()[0]
 
             return self.__response_feature_hits(hits)
 
-        end_index = offset + limit
-
         with DatabaseConnection(self.conn_dic,
                                 self.table,
-                                properties=self.properties) as db:
-            cursor = db.conn.cursor(cursor_factory=RealDictCursor)
-
+                                properties=self.properties,
+                                pool_size=self.pool_size) as db:
             props = db.columns if select_properties == [] else \
                 SQL(', ').join([Identifier(p) for p in select_properties])
 
-            geom = SQL('') if skip_geometry else \
-                SQL(",ST_AsGeoJSON({})").format(Identifier(self.geom))
+            geom = SQL('') if skip_geometry else self._sql_geojson
 
-            where_clause = self.__get_where_clauses(
+            where_clause, params = self.__get_where_clauses(
                 properties=properties, bbox=bbox)
 
             orderby = self._make_orderby(sortby) if sortby else SQL('')
 
-            sql_query = SQL("DECLARE \"geo_cursor\" CURSOR FOR \
-             SELECT DISTINCT {} {} FROM {} {} {}").\
-                format(props,
+            # rows including a unique id field are already distinct, which
+            # spares sorting/hashing every row (and its geometry)
+            selected = select_properties or db.fields.keys()
+            if self.id_field in selected and self._id_is_unique(db):
+                distinct = SQL('')
+            else:
+                distinct = SQL('DISTINCT')
+
+            sql_query = SQL("SELECT {} {} {} FROM {} {} {} \
+             LIMIT %s OFFSET %s").\
+                format(distinct,
+                       props,
                        geom,
-                       Identifier(self.table),
+                       self._sql_table,
                        where_clause,
                        orderby)
+            params += [limit, offset]
+
+            cursor = db.conn.cursor()
 
-            LOGGER.debug('SQL Query: {}'.format(sql_query.as_string(cursor)))
-            LOGGER.debug('Start Index: {}'.format(offset))
-            LOGGER.debug('End Index: {}'.format(end_index))
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('SQL Query: %s', sql_query.as_string(cursor))
+            LOGGER.debug('Offset: %s', offset)
+            LOGGER.debug('Limit: %s', limit)
             try:
-                cursor.execute(sql_query)
-                for index in [offset, limit]:
-                    cursor.execute("fetch forward {} from geo_cursor"
-                                   .format(index))
+                cursor.execute(sql_query, params)
             except Exception as err:
                 LOGGER.error('Error executing sql_query: {}'.format(
                     sql_query.as_string(cursor)))
                 LOGGER.error(err)
                 raise ProviderQueryError()
 
-            row_data = cursor.fetchall()
-
             feature_collection = {
                 'type': 'FeatureCollection',
                 'features': []
             }
 
-            for rd in row_data:
+            # build features row by row rather than materializing all rows
+            # with fetchall() alongside the features made from them; plain
+            # tuple rows are paired with the column names only once here
+            names = [desc[0] for desc in cursor.description]
+            for row in cursor:
                 feature_collection['features'].append(
-                    self.__response_feature(rd))
+                    self.__response_feature(zip(names, row)))
 
             return feature_collection
 
     def get_previous(self, cursor, identifier):
         """
-        Query previous ID given current ID
+        Query previous ID given current ID.  get() looks it up in the
+        item query itself; this is kept for subclasses and other callers
 
+        :param cursor: cursor of a DatabaseConnection
         :param identifier: feature id
 
         :returns: feature id
         """
-        sql = 'SELECT {} AS id FROM {} WHERE {}<%s ORDER BY {} DESC LIMIT 1'
-        cursor.execute(SQL(sql).format(
-            Identifier(self.id_field),
-            Identifier(self.table),
-            Identifier(self.id_field),
-            Identifier(self.id_field),
-        ), (identifier,))
-        item = cursor.fetchall()
-        id_ = item[0]['id'] if item else identifier
-        return id_
+
+        return self._get_adjacent(cursor, identifier, '<', 'DESC')
 
     def get_next(self, cursor, identifier):
         """
-        Query next ID given current ID
+        Query next ID given current ID.  get() looks it up in the item
+        query itself; this is kept for subclasses and other callers
 
+        :param cursor: cursor of a DatabaseConnection
         :param identifier: feature id
 
         :returns: feature id
         """
-        sql = 'SELECT {} AS id FROM {} WHERE {}>%s ORDER BY {} LIMIT 1'
+
+        return self._get_adjacent(cursor, identifier, '>', 'ASC')
+
+    def _get_adjacent(self, cursor, identifier, operator, order):
+        """
+        Private function: Query the ID adjacent to the given one
+
+        :param cursor: cursor of a DatabaseConnection, with tuple or
+                       dictionary rows
+        :param identifier: feature id
+        :param operator: comparison with the given ID, '<' or '>'
+        :param order: sort order of the IDs, 'DESC' or 'ASC'
+
+        :returns: feature id, or the given one if there is none
+        """
+
+        sql = 'SELECT {id} AS id FROM {table} WHERE {id}{operator}%s \
+            ORDER BY {id} {order} LIMIT 1'
         cursor.execute(SQL(sql).format(
-            Identifier(self.id_field),
-            Identifier(self.table),
-            Identifier(self.id_field),
-            Identifier(self.id_field),
-        ), (identifier,))
-        item = cursor.fetchall()
-        id_ = item[0]['id'] if item else identifier
-        return id_
+            id=self._sql_id, table=self._sql_table,
+            operator=SQL(operator), order=SQL(order)), (identifier,))
+        row = cursor.fetchone()
+        if row is None:
+            return identifier
+        return row['id'] if isinstance(row, dict) else row[0]
 
     def get(self, identifier, **kwargs):
         """
@@ -387,34 +666,48 @@ class PostgreSQLProvider(BaseProvider):
         LOGGER.debug('Get item from Postgis')
         with DatabaseConnection(self.conn_dic,
                                 self.table,
-                                properties=self.properties) as db:
-            cursor = db.conn.cursor(cursor_factory=RealDictCursor)
-
-            sql_query = SQL("SELECT {},ST_AsGeoJSON({}) \
-            from {} WHERE {}=%s").format(db.columns,
-                                         Identifier(self.geom),
-                                         Identifier(self.table),
-                                         Identifier(self.id_field))
-
-            LOGGER.debug('SQL Query: {}'.format(sql_query.as_string(db.conn)))
-            LOGGER.debug('Identifier: {}'.format(identifier))
+                                properties=self.properties,
+                                pool_size=self.pool_size) as db:
+            # previous and next IDs are looked up in the same round trip
+            sql_query = SQL('SELECT {columns}{geojson}, \
+                (SELECT {id} FROM {table} WHERE {id}<%s \
+                 ORDER BY {id} DESC LIMIT 1) AS {prev}, \
+                (SELECT {id} FROM {table} WHERE {id}>%s \
+                 ORDER BY {id} LIMIT 1) AS {next} \
+            FROM {table} WHERE {id}=%s').format(
+                columns=db.columns,
+                geojson=self._sql_geojson,
+                id=self._sql_id,
+                table=self._sql_table,
+                prev=Identifier(PREV_COLUMN),
+                next=Identifier(NEXT_COLUMN))
+
+            cursor = db.conn.cursor()
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('SQL Query: %s', sql_query.as_string(db.conn))
+            LOGGER.debug('Identifier: %s', identifier)
             try:
-                cursor.execute(sql_query, (identifier, ))
+                if self.prepared_statements:
+                    db.execute_prepared(cursor, sql_query, (identifier,) * 3)
+                else:
+                    cursor.execute(sql_query, (identifier,) * 3)
             except Exception as err:
                 LOGGER.error('Error executing sql_query: {}'.format(
                     sql_query.as_string(cursor)))
                 LOGGER.error(err)
                 raise ProviderQueryError()
 
-            results = cursor.fetchall()
+            results = _fetch_dicts(cursor)
             row_data = None
             if results:
                 row_data = results[0]
+                prev_ = row_data.pop(PREV_COLUMN)
+                next_ = row_data.pop(NEXT_COLUMN)
             feature = self.__response_feature(row_data)
 
             if feature:
-                feature['prev'] = self.get_previous(cursor, identifier)
-                feature['next'] = self.get_next(cursor, identifier)
+                feature['prev'] = prev_ if prev_ is not None else identifier
+                feature['next'] = next_ if next_ is not None else identifier
                 return feature
             else:
                 err = 'item {} not found'.format(identifier)
@@ -425,7 +718,8 @@ class PostgreSQLProvider(BaseProvider):
         """
         Assembles GeoJSON output from DB query
 
-        :param row_data: DB row result
+        :param row_data: DB row result, as a mapping or as an iterable
+                         of (column name, value) pairs
 
         :returns: `dict` of GeoJSON Feature
         """
@@ -460,3 +754,17 @@ class PostgreSQLProvider(BaseProvider):
         feature_collection['numberMatched'] = hits
 
         return feature_collection
+
+
+def _fetch_dicts(cursor):
+    """
+    Fetch the rows of a default (tuple) cursor as dictionaries, which is
+    cheaper than building them through psycopg2.extras.RealDictCursor
+
+    :param cursor: cursor holding query results
+
+    :returns: `list` of `dict` keyed by column name
+    """
+
+    names = [desc[0] for desc in cursor.description]
+    return [dict(zip(names, row)) for row in cursor]
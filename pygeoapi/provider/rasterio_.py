@@ -40,6 +40,21 @@ from pygeoapi.util import read_data
 
 LOGGER = logging.getLogger(__name__)
 
+PARAMETER_KEYS = ['id', 'description', 'unit_label', 'unit_symbol',
+                  'observed_property_id', 'observed_property_name']
+
+# band tags holding the parameter metadata, per driver
+PARAMETER_TAGS = {
+    'GRIB': {
+        'id': 'GRIB_ELEMENT',
+        'description': 'GRIB_COMMENT',
+        'unit_label': 'GRIB_UNIT',
+        'unit_symbol': 'GRIB_UNIT',
+        'observed_property_id': 'GRIB_SHORT_NAME',
+        'observed_property_name': 'GRIB_COMMENT'
+    }
+}
+
 
 class RasterioProvider(BaseProvider):
     """Rasterio Provider"""
@@ -71,29 +86,30 @@ class RasterioProvider(BaseProvider):
         :returns: CIS JSON object of domainset metadata
         """
 
+        c_props = self._coverage_properties
         domainset = {
             'type': 'DomainSet',
             'generalGrid': {
                 'type': 'GeneralGridCoverage',
-                'srsName': self._coverage_properties['bbox_crs'],
+                'srsName': c_props['bbox_crs'],
                 'axisLabels': [
-                    self._coverage_properties['x_axis_label'],
-                    self._coverage_properties['y_axis_label']
+                    c_props['x_axis_label'],
+                    c_props['y_axis_label']
                 ],
                 'axis': [{
                     'type': 'RegularAxis',
-                    'axisLabel': self._coverage_properties['x_axis_label'],
-                    'lowerBound': self._coverage_properties['bbox'][0],
-                    'upperBound': self._coverage_properties['bbox'][2],
-                    'uomLabel': self._coverage_properties['bbox_units'],
-                    'resolution': self._coverage_properties['resx']
+                    'axisLabel': c_props['x_axis_label'],
+                    'lowerBound': c_props['bbox'][0],
+                    'upperBound': c_props['bbox'][2],
+                    'uomLabel': c_props['bbox_units'],
+                    'resolution': c_props['resx']
                 }, {
                     'type': 'RegularAxis',
-                    'axisLabel': self._coverage_properties['y_axis_label'],
-                    'lowerBound': self._coverage_properties['bbox'][1],
-                    'upperBound': self._coverage_properties['bbox'][3],
-                    'uomLabel': self._coverage_properties['bbox_units'],
-                    'resolution': self._coverage_properties['resy']
+                    'axisLabel': c_props['y_axis_label'],
+                    'lowerBound': c_props['bbox'][1],
+                    'upperBound': c_props['bbox'][3],
+                    'uomLabel': c_props['bbox_units'],
+                    'resolution': c_props['resy']
                 }],
                 'gridLimits': {
                     'type': 'GridLimits',
@@ -103,17 +119,17 @@ class RasterioProvider(BaseProvider):
                         'type': 'IndexAxis',
                         'axisLabel': 'i',
                         'lowerBound': 0,
-                        'upperBound': self._coverage_properties['width']
+                        'upperBound': c_props['width']
                     }, {
                         'type': 'IndexAxis',
                         'axisLabel': 'j',
                         'lowerBound': 0,
-                        'upperBound': self._coverage_properties['height']
+                        'upperBound': c_props['height']
                     }]
                 }
             },
             '_meta': {
-                'tags': self._coverage_properties['tags']
+                'tags': c_props['tags']
             }
         }
 
@@ -130,14 +146,20 @@ class RasterioProvider(BaseProvider):
             'field': []
         }
 
-        for i, dtype, nodataval in zip(self._data.indexes, self._data.dtypes,
-                                       self._data.nodatavals):
-            LOGGER.debug('Determing rangetype for band {}'.format(i))
+        # the per-band properties of the dataset are read for all bands at
+        # once; reading them inside the loop would do so once per band
+        driver = self._data.driver
+        for i, dtype, nodataval, unit in zip(self._data.indexes,
+                                             self._data.dtypes,
+                                             self._data.nodatavals,
+                                             self._data.units):
+            LOGGER.debug('Determing rangetype for band %s', i)
+
+            tags = self._data.tags(i)
 
             name, units = None, None
-            if self._data.units[i-1] is None:
-                parameter = _get_parameter_metadata(
-                    self._data.profile['driver'], self._data.tags(i))
+            if unit is None:
+                parameter = _get_parameter_metadata(driver, tags)
                 name = parameter['description']
                 units = parameter['unit_label']
 
@@ -156,7 +178,7 @@ class RasterioProvider(BaseProvider):
                     'code': units
                 },
                 '_meta': {
-                    'tags': self._data.tags(i)
+                    'tags': tags
                 }
             })
 
@@ -176,7 +198,7 @@ class RasterioProvider(BaseProvider):
         """
 
         bands = properties
-        LOGGER.debug('Bands: {}, subsets: {}'.format(bands, subsets))
+        LOGGER.debug('Bands: %s, subsets: %s', bands, subsets)
 
         args = {
             'indexes': None
@@ -224,10 +246,10 @@ class RasterioProvider(BaseProvider):
                 minx2, miny2 = t.transform(minx, miny)
                 maxx2, maxy2 = t.transform(maxx, maxy)
 
-                LOGGER.debug('Source coordinates: {}'.format(
-                    [minx, miny, maxx, maxy]))
-                LOGGER.debug('Destination coordinates: {}'.format(
-                    [minx2, miny2, maxx2, maxy2]))
+                LOGGER.debug('Source coordinates: %s',
+                             [minx, miny, maxx, maxy])
+                LOGGER.debug('Destination coordinates: %s',
+                             [minx2, miny2, maxx2, maxy2])
 
                 shapes = [{
                    'type': 'Polygon',
@@ -262,66 +284,71 @@ class RasterioProvider(BaseProvider):
             LOGGER.debug('Selecting bands')
             args['indexes'] = list(map(int, bands))
 
-        with rasterio.open(self.data) as _data:
-            LOGGER.debug('Creating output coverage metadata')
-            out_meta = _data.meta
-
-            if self.options is not None:
-                LOGGER.debug('Adding dataset options')
-                for key, value in self.options.items():
-                    out_meta[key] = value
-
-            if shapes:  # spatial subset
-                try:
-                    LOGGER.debug('Clipping data with bbox')
-                    out_image, out_transform = rasterio.mask.mask(
-                        _data,
-                        filled=False,
-                        shapes=shapes,
-                        crop=True,
-                        indexes=args['indexes'])
-                except ValueError as err:
-                    LOGGER.error(err)
-                    raise ProviderQueryError(err)
-
-                out_meta.update({'driver': self.native_format,
-                                 'height': out_image.shape[1],
-                                 'width': out_image.shape[2],
-                                 'transform': out_transform})
-            else:  # no spatial subset
-                LOGGER.debug('Creating data in memory with band selection')
-                out_image = _data.read(indexes=args['indexes'])
-
-            if bbox:
-                out_meta['bbox'] = [bbox[0], bbox[1], bbox[2], bbox[3]]
-            elif shapes:
-                out_meta['bbox'] = [
-                    subsets[x][0], subsets[y][0],
-                    subsets[x][1], subsets[y][1]
-                ]
-            else:
-                out_meta['bbox'] = [
-                    _data.bounds.left,
-                    _data.bounds.bottom,
-                    _data.bounds.right,
-                    _data.bounds.top
-                ]
-
-            out_meta['units'] = _data.units
-
+        # query the dataset opened for this provider rather than opening
+        # (and for some drivers, scanning) the file a second time
+        _data = self._data
+
+        LOGGER.debug('Creating output coverage metadata')
+        out_meta = _data.meta
+
+        if self.options is not None:
+            LOGGER.debug('Adding dataset options')
+            for key, value in self.options.items():
+                out_meta[key] = value
+
+        if shapes:  # spatial subset
+            try:
+                LOGGER.debug('Clipping data with bbox')
+                out_image, out_transform = rasterio.mask.mask(
+                    _data,
+                    filled=False,
+                    shapes=shapes,
+                    crop=True,
+                    indexes=args['indexes'])
+            except ValueError as err:
+                LOGGER.error(err)
+                raise ProviderQueryError(err)
+
+            out_meta.update({'driver': self.native_format,
+                             'height': out_image.shape[1],
+                             'width': out_image.shape[2],
+                             'transform': out_transform})
+        else:  # no spatial subset
+            LOGGER.debug('Creating data in memory with band selection')
+            out_image = _data.read(indexes=args['indexes'])
+
+        if bbox:
+            out_meta['bbox'] = [bbox[0], bbox[1], bbox[2], bbox[3]]
+        elif shapes:
+            out_meta['bbox'] = [
+                subsets[x][0], subsets[y][0],
+                subsets[x][1], subsets[y][1]
+            ]
+        else:
+            out_meta['bbox'] = [
+                _data.bounds.left,
+                _data.bounds.bottom,
+                _data.bounds.right,
+                _data.bounds.top
+            ]
+
+        out_meta['units'] = _data.units
+
+        if format_ == 'json':
+            # CoverageJSON is built from the array directly, without
+            # encoding it to the native format first
+            LOGGER.debug('Creating output in CoverageJSON')
+            out_meta['bands'] = args['indexes']
+            return self.gen_covjson(out_meta, out_image)
+
+        else:  # return data in native format
             LOGGER.debug('Serializing data in memory')
             with MemoryFile() as memfile:
                 with memfile.open(**out_meta) as dest:
                     dest.write(out_image)
 
-                if format_ == 'json':
-                    LOGGER.debug('Creating output in CoverageJSON')
-                    out_meta['bands'] = args['indexes']
-                    return self.gen_covjson(out_meta, out_image)
-
-                else:  # return data in native format
-                    LOGGER.debug('Returning data in native format')
-                    return memfile.read()
+                LOGGER.debug('Returning data in native format')
+                return memfile.read()
 
     def gen_covjson(self, metadata, data):
         """
@@ -368,38 +395,39 @@ class RasterioProvider(BaseProvider):
         else:
             bands_select = metadata['bands']
 
-        LOGGER.debug('bands selected: {}'.format(bands_select))
-        for bs in bands_select:
-            pm = _get_parameter_metadata(
-                self._data.profile['driver'], self._data.tags(bs))
+        LOGGER.debug('bands selected: %s', bands_select)
+        driver = self._data.driver
+        try:
+            # data holds all selected bands, one (height, width) array each
+            for band_data, bs in zip(data, bands_select):
+                pm = _get_parameter_metadata(driver, self._data.tags(bs))
+
+                key = pm['id'] or str(bs)
 
-            parameter = {
-                'type': 'Parameter',
-                'description': pm['description'],
-                'unit': {
-                    'symbol': pm['unit_label']
-                },
-                'observedProperty': {
-                    'id': pm['observed_property_id'],
-                    'label': {
-                        'en': pm['observed_property_name']
+                cj['parameters'][key] = {
+                    'type': 'Parameter',
+                    'description': pm['description'],
+                    'unit': {
+                        'symbol': pm['unit_label']
+                    },
+                    'observedProperty': {
+                        'id': pm['observed_property_id'],
+                        'label': {
+                            'en': pm['observed_property_name']
+                        }
                     }
                 }
-            }
-
-            cj['parameters'][pm['id']] = parameter
 
-        try:
-            for key in cj['parameters'].keys():
+                # ravel() returns a view of the C-contiguous band rather
+                # than a copy, unlike flatten()
                 cj['ranges'][key] = {
                     'type': 'NdArray',
                     # 'dataType': metadata.dtypes[0],
                     'dataType': 'float',
                     'axisNames': ['y', 'x'],
                     'shape': [metadata['height'], metadata['width']],
+                    'values': band_data.ravel().tolist()
                 }
-                # TODO: deal with multi-band value output
-                cj['ranges'][key]['values'] = data.flatten().tolist()
         except IndexError as err:
             LOGGER.warning(err)
             raise ProviderQueryError('Invalid query parameter')
@@ -412,12 +440,18 @@ class RasterioProvider(BaseProvider):
         :returns: `dict` of coverage properties
         """
 
+        # each dataset property is derived from GDAL on access, so read
+        # them once
+        bounds = self._data.bounds
+        res = self._data.res
+        crs = self._data.crs
+
         properties = {
             'bbox': [
-                self._data.bounds.left,
-                self._data.bounds.bottom,
-                self._data.bounds.right,
-                self._data.bounds.top
+                bounds.left,
+                bounds.bottom,
+                bounds.right,
+                bounds.top
             ],
             'bbox_crs': 'http://www.opengis.net/def/crs/OGC/1.3/CRS84',
             'crs_type': 'GeographicCRS',
@@ -426,21 +460,21 @@ class RasterioProvider(BaseProvider):
             'y_axis_label': 'Lat',
             'width': self._data.width,
             'height': self._data.height,
-            'resx': self._data.res[0],
-            'resy': self._data.res[1],
+            'resx': res[0],
+            'resy': res[1],
             'num_bands': self._data.count,
             'tags': self._data.tags()
         }
 
-        if self._data.crs is not None:
-            if self._data.crs.is_projected:
+        if crs is not None:
+            if crs.is_projected:
                 properties['bbox_crs'] = '{}/{}'.format(
                     'http://www.opengis.net/def/crs/OGC/1.3/',
-                    self._data.crs.to_epsg())
+                    crs.to_epsg())
 
                 properties['x_axis_label'] = 'x'
                 properties['y_axis_label'] = 'y'
-                properties['bbox_units'] = self._data.crs.linear_units
+                properties['bbox_units'] = crs.linear_units
                 properties['crs_type'] = 'ProjectedCRS'
 
         properties['axes'] = [
@@ -458,21 +492,8 @@ def _get_parameter_metadata(driver, band):
     :returns: dict of parameter metadata
     """
 
-    parameter = {
-        'id': None,
-        'description': None,
-        'unit_label': None,
-        'unit_symbol': None,
-        'observed_property_id': None,
-        'observed_property_name': None
-    }
-
-    if driver == 'GRIB':
-        parameter['id'] = band['GRIB_ELEMENT']
-        parameter['description'] = band['GRIB_COMMENT']
-        parameter['unit_label'] = band['GRIB_UNIT']
-        parameter['unit_symbol'] = band['GRIB_UNIT']
-        parameter['observed_property_id'] = band['GRIB_SHORT_NAME']
-        parameter['observed_property_name'] = band['GRIB_COMMENT']
+    tags = PARAMETER_TAGS.get(driver)
+    if tags is None:
+        return dict.fromkeys(PARAMETER_KEYS)
 
-    return parameter
+    return {key: band[tag] for key, tag in tags.items()}
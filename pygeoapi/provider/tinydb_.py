@@ -128,8 +128,9 @@ class TinyDBCatalogueProvider(BaseProvider):
 
         if bbox:
             LOGGER.debug('processing bbox parameter')
-            bbox_as_string = ','.join(str(s) for s in bbox)
-            QUERY.append("Q.properties.extent.spatial.bbox.test(bbox_intersects, '{}')".format(bbox_as_string))  # noqa
+            # parsed once here rather than once per record tested
+            input_bbox = tuple(float(s) for s in bbox)  # noqa
+            QUERY.append("Q.properties.extent.spatial.bbox.test(bbox_intersects, input_bbox)")  # noqa
 
         if datetime_ is not None:
             LOGGER.debug('processing datetime parameter')
@@ -247,13 +248,13 @@ def bbox_intersects(record_bbox, input_bbox):
     Manual bbox intersection calculation
 
     :param record_bbox: `dict` of polygon geometry
-    :param input_bbox: `str` of 'minx,miny,maxx,maxy'
+    :param input_bbox: `tuple` of minx,miny,maxx,maxy
 
     :returns: `bool` of whether the record_bbox intersects input_bbox
     """
 
     bbox1 = record_bbox[0]
-    bbox2 = [float(c) for c in input_bbox.split(',')]
+    bbox2 = input_bbox
 
     LOGGER.debug('Record bbox: {}'.format(bbox1))
     LOGGER.debug('Input bbox: {}'.format(bbox2))
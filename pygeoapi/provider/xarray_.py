@@ -35,6 +35,14 @@ import zipfile
 import xarray
 import numpy as np
 
+try:
+    from shapely import intersects_xy
+except ImportError:  # shapely < 2
+    from shapely.vectorized import contains, touches
+
+    def intersects_xy(geometry, x, y):
+        return contains(geometry, x, y) | touches(geometry, x, y)
+
 from pygeoapi.provider.base import (BaseProvider,
                                     ProviderConnectionError,
                                     ProviderNoDataError,
@@ -153,7 +161,7 @@ class XarrayProvider(BaseProvider):
         }
 
         for name, var in self._data.variables.items():
-            LOGGER.debug('Determining rangetype for {}'.format(name))
+            LOGGER.debug('Determining rangetype for %s', name)
 
             desc, units = None, None
             if len(var.shape) >= 3:
@@ -184,7 +192,7 @@ class XarrayProvider(BaseProvider):
         return rangetype
 
     def query(self, properties=[], subsets={}, bbox=[], datetime_=None,
-              format_='json', **kwargs):
+              format_='json', geometry=None, **kwargs):
         """
          Extract data from collection collection
 
@@ -193,6 +201,8 @@ class XarrayProvider(BaseProvider):
         :param bbox: bounding box [minx,miny,maxx,maxy]
         :param datetime_: temporal (datestamp or extent)
         :param format_: data format of output
+        :param geometry: `shapely.geometry` outside of which cells are
+                         returned as missing values (default None)
 
         :returns: coverage data as dict of CoverageJSON or native format
         """
@@ -218,7 +228,7 @@ class XarrayProvider(BaseProvider):
 
             query_params = {}
             for key, val in subsets.items():
-                LOGGER.debug('Processing subset: {}'.format(key))
+                LOGGER.debug('Processing subset: %s', key)
                 if data.coords[key].values[0] > data.coords[key].values[-1]:
                     LOGGER.debug('Reversing slicing from high to low')
                     query_params[key] = slice(val[1], val[0])
@@ -254,7 +264,7 @@ class XarrayProvider(BaseProvider):
                     else:
                         query_params[self.time_field] = datetime_
 
-            LOGGER.debug('Query parameters: {}'.format(query_params))
+            LOGGER.debug('Query parameters: %s', query_params)
             try:
                 data = data.sel(query_params)
             except Exception as err:
@@ -268,6 +278,16 @@ class XarrayProvider(BaseProvider):
             LOGGER.warning(msg)
             raise ProviderNoDataError(msg)
 
+        # a subset is rectangular already, other geometries mask the cells
+        # whose coordinates fall outside of them
+        if geometry is not None and not geometry.equals(geometry.envelope):
+            LOGGER.debug('Masking cells outside of geometry')
+            x, y = np.meshgrid(data.coords[self.x_field].values,
+                               data.coords[self.y_field].values)
+            data = data.where(xarray.DataArray(
+                intersects_xy(geometry, x, y),
+                dims=(self.y_field, self.x_field)))
+
         out_meta = {
             'bbox': [
                 data.coords[self.x_field].values[0],
@@ -295,11 +315,10 @@ class XarrayProvider(BaseProvider):
             LOGGER.debug('Returning data in native zarr format')
             return _get_zarr_data(data)
         else:  # return data in native format
-            with tempfile.TemporaryFile() as fp:
-                LOGGER.debug('Returning data in native NetCDF format')
-                fp.write(data.to_netcdf())
-                fp.seek(0)
-                return fp.read()
+            # without a path, to_netcdf() returns the file contents as
+            # bytes already
+            LOGGER.debug('Returning data in native NetCDF format')
+            return data.to_netcdf()
 
     def gen_covjson(self, metadata, data, range_type):
         """
@@ -326,7 +345,7 @@ class XarrayProvider(BaseProvider):
             tmp_max = data.coords[self.y_field].values
 
         if tmp_min > tmp_max:
-            LOGGER.debug('Reversing direction of {}'.format(self.y_field))
+            LOGGER.debug('Reversing direction of %s', self.y_field)
             miny = tmp_max
             maxy = tmp_min
 
@@ -385,6 +404,8 @@ class XarrayProvider(BaseProvider):
             cj['parameters'][pm['id']] = parameter
 
         try:
+            data = data.fillna(None)
+
             for key in cj['parameters'].keys():
                 cj['ranges'][key] = {
                     'type': 'NdArray',
@@ -397,8 +418,7 @@ class XarrayProvider(BaseProvider):
                               metadata['time_steps']]
                 }
 
-                data = data.fillna(None)
-                cj['ranges'][key]['values'] = data[key].values.flatten().tolist()  # noqa
+                cj['ranges'][key]['values'] = data[key].values.ravel().tolist()  # noqa
         except IndexError as err:
             LOGGER.warning(err)
             raise ProviderQueryError('Invalid query parameter')
@@ -35,6 +35,14 @@ from pygeoapi.provider.xarray_ import _to_datetime_string, XarrayProvider
 
 LOGGER = logging.getLogger(__name__)
 
+# x and y axis selectors of position query geometries, per geometry type
+WKT_SELECTORS = {
+    'Point': lambda wkt: (wkt.x, wkt.y),
+    'LineString': lambda wkt: wkt.xy,
+    'Polygon': lambda wkt: (slice(wkt.bounds[0], wkt.bounds[2]),
+                            slice(wkt.bounds[1], wkt.bounds[3]))
+}
+
 
 class XarrayEDRProvider(BaseEDRProvider, XarrayProvider):
     """EDR Provider"""
@@ -48,8 +56,8 @@ class XarrayEDRProvider(BaseEDRProvider, XarrayProvider):
         :returns: pygeoapi.provider.rasterio_.RasterioProvider
         """
 
-        BaseEDRProvider.__init__(self, provider_def)
-        XarrayProvider.__init__(self, provider_def)
+        # BaseEDRProvider initializes XarrayProvider through the MRO
+        super().__init__(provider_def)
 
     def get_fields(self):
         """
@@ -77,24 +85,19 @@ class XarrayEDRProvider(BaseEDRProvider, XarrayProvider):
 
         query_params = {}
 
-        LOGGER.debug('Query parameters: {}'.format(kwargs))
+        LOGGER.debug('Query parameters: %s', kwargs)
 
-        LOGGER.debug('Query type: {}'.format(kwargs.get('query_type')))
+        LOGGER.debug('Query type: %s', kwargs.get('query_type'))
 
         wkt = kwargs.get('wkt')
         if wkt is not None:
             LOGGER.debug('Processing WKT')
-            LOGGER.debug('Geometry type: {}'.format(wkt.type))
-            if wkt.type == 'Point':
-                query_params[self._coverage_properties['x_axis_label']] = wkt.x
-                query_params[self._coverage_properties['y_axis_label']] = wkt.y
-            elif wkt.type == 'LineString':
-                query_params[self._coverage_properties['x_axis_label']] = wkt.xy[0]  # noqa
-                query_params[self._coverage_properties['y_axis_label']] = wkt.xy[1]  # noqa
-            elif wkt.type == 'Polygon':
-                query_params[self._coverage_properties['x_axis_label']] = slice(wkt.bounds[0], wkt.bounds[2])  # noqa
-                query_params[self._coverage_properties['y_axis_label']] = slice(wkt.bounds[1], wkt.bounds[3])  # noqa
-                pass
+            LOGGER.debug('Geometry type: %s', wkt.type)
+            selector = WKT_SELECTORS.get(wkt.type)
+            if selector is not None:
+                x, y = selector(wkt)
+                query_params[self._coverage_properties['x_axis_label']] = x
+                query_params[self._coverage_properties['y_axis_label']] = y
 
         LOGGER.debug('Processing parameter-name')
         select_properties = kwargs.get('select_properties')
@@ -102,13 +105,13 @@ class XarrayEDRProvider(BaseEDRProvider, XarrayProvider):
         # example of fetching instance passed
         # TODO: apply accordingly
         instance = kwargs.get('instance')
-        LOGGER.debug('instance: {}'.format(instance))
+        LOGGER.debug('instance: %s', instance)
 
         datetime_ = kwargs.get('datetime_')
         if datetime_ is not None:
             query_params[self._coverage_properties['time_axis_label']] = datetime_  # noqa
 
-        LOGGER.debug('query parameters: {}'.format(query_params))
+        LOGGER.debug('query parameters: %s', query_params)
 
         try:
             if select_properties:
@@ -148,3 +151,41 @@ class XarrayEDRProvider(BaseEDRProvider, XarrayProvider):
         }
 
         return self.gen_covjson(out_meta, data, self.fields)
+
+    @BaseEDRProvider.register()
+    def area(self, **kwargs):
+        """
+        Extract data from collection collection
+
+        :param query_type: query type
+        :param wkt: `shapely.geometry` WKT geometry
+        :param datetime_: temporal (datestamp or extent)
+        :param select_properties: list of parameters
+        :param z: vertical level(s)
+        :param format_: data format of output
+
+        :returns: coverage data as dict of CoverageJSON or native format,
+                  with cells outside of the area as missing values
+        """
+
+        LOGGER.debug('Query parameters: %s', kwargs)
+
+        # CoverageJSON is also what HTML responses are rendered from
+        format_ = kwargs.get('format_')
+        if format_ in [None, 'html']:
+            format_ = 'json'
+
+        # subset by the extent of the area so that xarray only reads
+        # the intersecting cells from the underlying store, then mask
+        # the cells outside of the area itself
+        wkt = kwargs['wkt']
+        minx, miny, maxx, maxy = wkt.bounds
+        subsets = {
+            self._coverage_properties['x_axis_label']: [minx, maxx],
+            self._coverage_properties['y_axis_label']: [miny, maxy]
+        }
+
+        return XarrayProvider.query(
+            self, properties=kwargs.get('select_properties') or [],
+            subsets=subsets, datetime_=kwargs.get('datetime_'),
+            format_=format_, geometry=wkt)
@@ -1487,6 +1487,39 @@ def test_get_collection_edr_query(config, api_):
     assert len(data['parameters'].keys()) == 1
     assert list(data['parameters'].keys())[0] == 'SST'
 
+    # area query
+    req = mock_request({
+        'coords': 'POLYGON((-20 -10, 20 -10, 20 10, -20 10, -20 -10))',
+        'parameter-name': 'SST'
+    })
+    rsp_headers, code, response = api_.get_collection_edr_query(
+        req, 'icoads-sst', None, 'area')
+    assert code == 200
+
+    data = json.loads(response)
+
+    assert data['domain']['axes']['x']['start'] == -19.0
+    assert data['domain']['axes']['x']['stop'] == 19.0
+    assert data['domain']['axes']['y']['start'] == 9.0
+    assert data['domain']['axes']['y']['stop'] == -9.0
+    assert list(data['parameters'].keys()) == ['SST']
+    assert data['ranges']['SST']['shape'] == [10, 20, 12]
+
+    # area query, cells outside of the polygon are missing values
+    req = mock_request({
+        'coords': 'POLYGON((-20 -10, 20 -10, -20 10, -20 -10))',
+        'parameter-name': 'SST'
+    })
+    rsp_headers, code, response = api_.get_collection_edr_query(
+        req, 'icoads-sst', None, 'area')
+    assert code == 200
+
+    data = json.loads(response)
+
+    assert data['ranges']['SST']['shape'] == [10, 20, 12]
+    values = data['ranges']['SST']['values']
+    assert len([value for value in values if value is not None]) == 1200
+
     # some data
     req = mock_request({
         'coords': 'POINT(11 11)', 'datetime': '2000-01-16'
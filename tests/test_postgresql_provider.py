@@ -32,9 +32,11 @@
 # Needs to be run like: python3 -m pytest
 
 import pytest
+from psycopg2.extras import RealDictCursor
 
 from pygeoapi.provider.base import ProviderItemNotFoundError
-from pygeoapi.provider.postgresql import PostgreSQLProvider
+from pygeoapi.provider.postgresql import (DatabaseConnection,
+                                          PostgreSQLProvider)
 
 import os
 PASSWORD = os.environ.get('POSTGRESQL_PASSWORD', 'postgres')
@@ -123,6 +125,24 @@ def test_query_with_property_filter(config):
     assert (len(other_features) != 0)
 
 
+def test_query_with_property_filters(config):
+    """Test query valid features when filtering by several properties"""
+    p = PostgreSQLProvider(config)
+    feature_collection = p.query(
+        properties=[('waterway', 'drain'), ('width', '50')], limit=50)
+    features = feature_collection['features']
+    assert len(features) == 33
+    for feature in features:
+        assert feature['properties']['waterway'] == 'drain'
+        assert feature['properties']['width'] == '50'
+
+    # property values, then bbox, then limit/offset parameters
+    feature_collection = p.query(
+        properties=[('waterway', 'drain')], bbox=[29.3, -3.5, 29.4, -3.3],
+        limit=10, offset=45)
+    assert len(feature_collection['features']) == 5
+
+
 def test_query_with_config_properties(config_with_properties):
     """
     Test that query is restricted by properties in the config.
@@ -150,6 +170,14 @@ def test_query_hits(config):
     results = psp.query(properties=[("waterway", "stream")], resulttype="hits")
     assert results["numberMatched"] == 13930
 
+    results = psp.query(properties=[("waterway", "drain")],
+                        bbox=[29.3, -3.5, 29.4, -3.3], resulttype="hits")
+    assert results["numberMatched"] == 50
+
+    results = psp.query(properties=[("waterway", "drain"), ("width", "50")],
+                        bbox=[29.3, -3.5, 29.4, -3.3], resulttype="hits")
+    assert results["numberMatched"] == 8
+
 
 def test_query_bbox(config):
     """Test query with a specified bounding box"""
@@ -195,6 +223,33 @@ def test_get(config):
     assert 'properties' in result
     assert 'id' in result
     assert 'Kanyosha' in result['properties']['name']
+    assert result['prev'] == 29698243
+    assert result['next'] == 29704504
+
+
+def test_get_first_last(config):
+    """Testing prev/next of the first and last objects"""
+    p = PostgreSQLProvider(config)
+    first = p.get(13990765)
+    assert first['prev'] == 13990765
+    assert first['next'] == 25469515
+
+    last = p.get(620735702)
+    assert last['prev'] == 620420337
+    assert last['next'] == 620735702
+
+
+def test_get_previous_next(config):
+    """Testing previous/next ID lookups with a caller's cursor"""
+    p = PostgreSQLProvider(config)
+    with DatabaseConnection(p.conn_dic, p.table) as db:
+        cursor = db.conn.cursor()
+        assert p.get_previous(cursor, 29701937) == 29698243
+        assert p.get_next(cursor, 29701937) == 29704504
+        assert p.get_previous(cursor, 13990765) == 13990765
+
+        cursor = db.conn.cursor(cursor_factory=RealDictCursor)
+        assert p.get_next(cursor, 620735702) == 620735702
 
 
 def test_get_not_existing_item_raise_exception(config):
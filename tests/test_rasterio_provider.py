@@ -105,3 +105,6 @@ def test_query_bbox_reprojection(config):
     assert data['domain']['axes']['x']['stop'] == -75.0
     assert data['domain']['axes']['y']['start'] == 49.0
     assert data['domain']['axes']['y']['stop'] == 45.0
+
+    for range_ in data['ranges'].values():
+        assert len(range_['values']) == range_['shape'][0] * range_['shape'][1]